@@ -6,6 +6,8 @@ from typing import Annotated
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
+_DEFAULT_CORS_ORIGINS: tuple[str, ...] = ("http://localhost:3000",)
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -22,7 +24,7 @@ class Settings(BaseSettings):
     supabase_storage_bucket: str = "voice-audio"
 
     cors_origins: Annotated[list[str], NoDecode] = Field(
-        default_factory=lambda: ["http://localhost:3000"]
+        default_factory=lambda: list(_DEFAULT_CORS_ORIGINS)
     )
     max_audio_mb: int = 10
 
@@ -30,13 +32,15 @@ class Settings(BaseSettings):
     @classmethod
     def parse_cors_origins(cls, value: object) -> list[str]:
         if value is None:
-            return ["http://localhost:3000"]
+            return list(_DEFAULT_CORS_ORIGINS)
         if isinstance(value, str):
-            items = [item.strip() for item in value.split(",") if item.strip()]
-            return items or ["http://localhost:3000"]
-        if isinstance(value, list):
-            return [str(item).strip() for item in value if str(item).strip()]
-        raise ValueError("Invalid CORS_ORIGINS value")
+            items: list[object] = value.split(",")
+        elif isinstance(value, list):
+            items = value
+        else:
+            raise ValueError("Invalid CORS_ORIGINS value")
+        cleaned = [origin for origin in (str(item).strip() for item in items) if origin]
+        return cleaned or list(_DEFAULT_CORS_ORIGINS)
 
 
 @lru_cache(maxsize=1)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -17,7 +17,7 @@ class APIError(Exception):
 
 
 def _request_id(request: Request) -> str:
-    return getattr(request.state, "request_id", "unknown")
+    return request.scope.get("request_id", "unknown")
 
 
 def _error_body(*, request: Request, code: str, message: str) -> dict[str, dict[str, str]]:
@@ -26,34 +26,33 @@ def _error_body(*, request: Request, code: str, message: str) -> dict[str, dict[
 
 def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(APIError)
-    async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
-        return JSONResponse(
+    async def api_error_handler(request: Request, exc: APIError) -> ORJSONResponse:
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=_error_body(request=request, code=exc.code, message=exc.message),
         )
 
     @app.exception_handler(RequestValidationError)
-    async def validation_error_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
-        message = "; ".join(
-            f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in exc.errors()
-        )
-        return JSONResponse(
+    async def validation_error_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
+        errors = exc.errors()
+        message = "; ".join(["%s: %s" % (".".join(map(str, err["loc"])), err["msg"]) for err in errors])
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content=_error_body(request=request, code="VALIDATION_ERROR", message=message),
         )
 
     @app.exception_handler(HTTPException)
-    async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+    async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
         message = str(exc.detail) if exc.detail else "Request failed"
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=_error_body(request=request, code="HTTP_ERROR", message=message),
         )
 
     @app.exception_handler(Exception)
-    async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def unhandled_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
         logger.exception("unhandled_exception", error=str(exc))
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content=_error_body(
                 request=request,
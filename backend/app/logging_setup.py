@@ -8,11 +8,18 @@ import sys
 from copy import copy
 from typing import Any
 
+import orjson
 import structlog
 
 _listener: logging.handlers.QueueListener | None = None
 _configured = False
 
+_UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+
+def _orjson_dumps(value: Any, **kwargs: Any) -> str:
+    return orjson.dumps(value, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class PreservingQueueHandler(logging.handlers.QueueHandler):
     """Keep structured log records intact for ProcessorFormatter in listener thread."""
@@ -33,8 +40,15 @@ def configure_logging(service: str, level: str = "INFO") -> None:
     root_logger.setLevel(level.upper())
     root_logger.addHandler(PreservingQueueHandler(log_queue))
 
+    # uvicorn installs its own stream handlers; send its records through the queue
+    # too so no log write happens on the event loop.
+    for name in _UVICORN_LOGGERS:
+        server_logger = logging.getLogger(name)
+        server_logger.handlers.clear()
+        server_logger.propagate = True
+
     formatter = structlog.stdlib.ProcessorFormatter(
-        processor=structlog.processors.JSONRenderer(),
+        processor=structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         foreign_pre_chain=[
             structlog.processors.TimeStamper(fmt="iso", utc=True),
             structlog.stdlib.add_log_level,
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from time import perf_counter
-from typing import Any
 from uuid import UUID
 
 import structlog
-from fastapi import Depends, FastAPI, Request, UploadFile, status
+from fastapi import FastAPI, Request, UploadFile, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter, ValidationError
 
 from app.config import Settings, get_settings
 from app.errors import APIError, register_exception_handlers
@@ -20,21 +22,59 @@ from app.schemas import (
     CreateSummaryRequestInput,
     CreateSummaryRequestResponse,
     RequestStatusResponse,
-    SummaryPayload,
 )
 
 logger = structlog.get_logger(__name__)
 
-ALLOWED_AUDIO_TYPES = {"audio/webm", "audio/ogg", "audio/wav", "audio/mpeg"}
+UPLOAD_CHUNK_BYTES = 64 * 1024
+ALLOWED_AUDIO_TYPES: frozenset[str] = frozenset({"audio/webm", "audio/ogg", "audio/wav", "audio/mpeg"})
+
+
+def _normalize_content_type(content_type: str | None) -> tuple[str, str]:
+    raw = (content_type or "").strip().lower()
+    return raw, raw.partition(";")[0].rstrip()
+
+
+_UUID_ADAPTER = TypeAdapter(UUID)
+
+
+def _parse_request_id(value: str) -> UUID | None:
+    # Cheap shape check first so obviously malformed ids skip full UUID parsing.
+    if len(value) != 36 or value[8] != "-":
+        return None
+    try:
+        return _UUID_ADAPTER.validate_python(value)
+    except ValidationError:
+        return None
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
     configure_logging(service="backend", level=settings.log_level)
 
-    app = FastAPI(title=settings.app_name)
+    # Handlers below run per request; bind hot globals as closure locals once.
+    _perf_counter = perf_counter
+    _round = round
+    _log_info = logger.info
+    _log_exception = logger.exception
+
+    repository = SupabaseRepository(settings)
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        # Open the pooled connection (TCP + TLS) before the first user request needs it.
+        try:
+            await repository.check_ready()
+        except Exception as exc:
+            logger.warning("supabase_warmup_failed", error=str(exc))
+        try:
+            yield
+        finally:
+            await repository.aclose()
+
+    app = FastAPI(title=settings.app_name, default_response_class=ORJSONResponse, lifespan=lifespan)
     app.state.settings = settings
-    app.state.repository = SupabaseRepository(settings)
+    app.state.repository = repository
 
     app.add_middleware(
         CORSMiddleware,
@@ -52,29 +92,36 @@ def create_app() -> FastAPI:
         return {"status": "ok"}
 
     @app.get("/readyz")
-    async def readyz(repo: SummaryRepository = Depends(get_repository)) -> JSONResponse:
-        started = perf_counter()
+    async def readyz(request: Request) -> ORJSONResponse:
+        repo = get_repository(request)
+        started = _perf_counter()
         try:
             await repo.check_ready()
         except Exception as exc:
-            logger.exception("readyz_failed", error=str(exc))
+            _log_exception("readyz_failed", error=str(exc))
             raise APIError(
                 code="DEPENDENCY_UNAVAILABLE",
                 message="Supabase check failed",
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             ) from exc
 
-        logger.info("readyz_ok", duration_ms=round((perf_counter() - started) * 1000, 2))
-        return JSONResponse(status_code=status.HTTP_200_OK, content={"status": "ready"})
-
-    @app.post("/v1/audio", response_model=AudioUploadResponse, status_code=status.HTTP_201_CREATED)
-    async def create_audio(
-        file: UploadFile,
-        repo: SummaryRepository = Depends(get_repository),
-        settings: Settings = Depends(get_app_settings),
-    ) -> AudioUploadResponse:
-        raw_content_type = (file.content_type or "").lower().strip()
-        content_type = raw_content_type.split(";", 1)[0].strip()
+        _log_info("readyz_ok", duration_ms=_round((_perf_counter() - started) * 1000, 2))
+        return ORJSONResponse(status_code=status.HTTP_200_OK, content={"status": "ready"})
+
+    # Response bodies below are built from our own repository rows, so they are
+    # encoded straight to ORJSONResponse: no response_model re-validation and no
+    # jsonable_encoder pass. The models stay attached via `responses` for the
+    # OpenAPI schema. Request bodies (CreateSummaryRequestInput) keep full validation.
+    @app.post(
+        "/v1/audio",
+        response_model=None,
+        responses={status.HTTP_201_CREATED: {"model": AudioUploadResponse}},
+        status_code=status.HTTP_201_CREATED,
+    )
+    async def create_audio(request: Request, file: UploadFile) -> ORJSONResponse:
+        repo = get_repository(request)
+        settings = get_app_settings(request)
+        raw_content_type, content_type = _normalize_content_type(file.content_type)
         if content_type not in ALLOWED_AUDIO_TYPES:
             raise APIError(
                 code="UNSUPPORTED_MEDIA_TYPE",
@@ -83,24 +130,27 @@ def create_app() -> FastAPI:
             )
 
         max_bytes = settings.max_audio_mb * 1024 * 1024
-        read_started = perf_counter()
-        data = await file.read(max_bytes + 1)
-        read_duration = round((perf_counter() - read_started) * 1000, 2)
-
-        if not data:
+        read_started = _perf_counter()
+        buffer = bytearray()
+        while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+            buffer.extend(chunk)
+            if len(buffer) > max_bytes:
+                raise APIError(
+                    code="PAYLOAD_TOO_LARGE",
+                    message=f"Audio exceeds {settings.max_audio_mb} MB limit",
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                )
+        read_duration = _round((_perf_counter() - read_started) * 1000, 2)
+
+        if not buffer:
             raise APIError(code="EMPTY_FILE", message="Audio file is empty", status_code=status.HTTP_400_BAD_REQUEST)
-        if len(data) > max_bytes:
-            raise APIError(
-                code="PAYLOAD_TOO_LARGE",
-                message=f"Audio exceeds {settings.max_audio_mb} MB limit",
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            )
+        data = bytes(buffer)
 
-        insert_started = perf_counter()
+        insert_started = _perf_counter()
         audio_id = await repo.create_audio_asset(data=data, content_type=content_type)
-        insert_duration = round((perf_counter() - insert_started) * 1000, 2)
+        insert_duration = _round((_perf_counter() - insert_started) * 1000, 2)
 
-        logger.info(
+        _log_info(
             "audio_uploaded",
             audio_id=str(audio_id),
             content_type=content_type,
@@ -109,63 +159,71 @@ def create_app() -> FastAPI:
             read_duration_ms=read_duration,
             upload_duration_ms=insert_duration,
         )
-        return AudioUploadResponse(audio_id=audio_id)
+        return ORJSONResponse(status_code=status.HTTP_201_CREATED, content={"audio_id": audio_id})
 
-    @app.post("/v1/requests", response_model=CreateSummaryRequestResponse, status_code=status.HTTP_201_CREATED)
-    async def create_request(
-        payload: CreateSummaryRequestInput,
-        repo: SummaryRepository = Depends(get_repository),
-    ) -> CreateSummaryRequestResponse:
+    @app.post(
+        "/v1/requests",
+        response_model=None,
+        responses={status.HTTP_201_CREATED: {"model": CreateSummaryRequestResponse}},
+        status_code=status.HTTP_201_CREATED,
+    )
+    async def create_request(request: Request, payload: CreateSummaryRequestInput) -> ORJSONResponse:
+        repo = get_repository(request)
         send_at = payload.send_at or datetime.now(timezone.utc)
-        start = perf_counter()
+        start = _perf_counter()
         record = await repo.create_summary_request(email=payload.email, audio_id=payload.audio_id, send_at=send_at)
-        logger.info(
+        _log_info(
             "summary_request_created",
             request_id=record["id"],
             email=payload.email,
-            duration_ms=round((perf_counter() - start) * 1000, 2),
+            duration_ms=_round((_perf_counter() - start) * 1000, 2),
         )
-        return CreateSummaryRequestResponse(
-            request_id=record["id"],
-            status=record["status"],
-            send_at=record["send_at"],
+        return ORJSONResponse(
+            status_code=status.HTTP_201_CREATED,
+            content={
+                "request_id": record["id"],
+                "status": record["status"],
+                "send_at": record["send_at"],
+            },
         )
 
-    @app.get("/v1/requests/{request_id}", response_model=RequestStatusResponse)
-    async def get_request(
-        request_id: UUID,
-        repo: SummaryRepository = Depends(get_repository),
-    ) -> RequestStatusResponse:
-        start = perf_counter()
-        record = await repo.get_summary_request(request_id)
+    @app.get(
+        "/v1/requests/{request_id}",
+        response_model=None,
+        responses={status.HTTP_200_OK: {"model": RequestStatusResponse}},
+    )
+    async def get_request(request: Request, request_id: str) -> ORJSONResponse:
+        repo = get_repository(request)
+        start = _perf_counter()
+        parsed_id = _parse_request_id(request_id)
+        record = await repo.get_summary_request(parsed_id) if parsed_id is not None else None
         if record is None:
             raise APIError(code="NOT_FOUND", message="Summary request not found", status_code=status.HTTP_404_NOT_FOUND)
 
-        summary: SummaryPayload | None = None
-        summary_data: Any = record.get("summary_json")
-        if summary_data:
-            summary = SummaryPayload.model_validate(summary_data)
-
-        logger.info(
+        _log_info(
             "summary_request_fetched",
-            request_id=str(request_id),
+            request_id=request_id,
             status=record["status"],
-            duration_ms=round((perf_counter() - start) * 1000, 2),
+            duration_ms=_round((_perf_counter() - start) * 1000, 2),
         )
 
-        return RequestStatusResponse(
-            request_id=record["id"],
-            status=record["status"],
-            send_at=record["send_at"],
-            attempts=record["attempts"],
-            last_error=record.get("last_error"),
-            summary=summary,
-            transcript_text=record.get("transcript_text"),
+        return ORJSONResponse(
+            content={
+                "request_id": record["id"],
+                "status": record["status"],
+                "send_at": record["send_at"],
+                "attempts": record["attempts"],
+                "last_error": record.get("last_error"),
+                "summary": record.get("summary_json") or None,
+                "transcript_text": record.get("transcript_text"),
+            }
         )
 
     return app
 
 
+# Plain accessors rather than Depends(): both are app-wide singletons, so there is
+# nothing for FastAPI's dependency solver to do per request.
 def get_app_settings(request: Request) -> Settings:
     return request.app.state.settings
 
@@ -174,4 +232,11 @@ def get_repository(request: Request) -> SummaryRepository:
     return request.app.state.repository
 
 
-app = create_app()
+def __getattr__(name: str) -> FastAPI:
+    # Build the ASGI app on first access (`uvicorn app.main:app`) rather than at import,
+    # so importing this module (e.g. from tests) needs no Supabase settings or client.
+    if name == "app":
+        application = create_app()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
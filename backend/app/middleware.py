@@ -1,35 +1,55 @@
 from __future__ import annotations
 
+import os
 from time import perf_counter
-from uuid import uuid4
 
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = structlog.get_logger(__name__)
 
+_REQUEST_ID_HEADER = b"x-request-id"
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):  # type: ignore[no-untyped-def]
-        request_id = request.headers.get("X-Request-ID") or str(uuid4())
-        request.state.request_id = request_id
-        structlog.contextvars.clear_contextvars()
-        structlog.contextvars.bind_contextvars(request_id=request_id)
+
+class RequestIDMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = ""
+        for name, value in scope["headers"]:
+            if name == _REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")
+                break
+        if not request_id:
+            request_id = os.urandom(16).hex()
+        request_id_bytes = request_id.encode("latin-1")
+
+        scope["request_id"] = request_id
+
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", ()), (_REQUEST_ID_HEADER, request_id_bytes)]
+            await send(message)
 
         start = perf_counter()
-        try:
-            response = await call_next(request)
+        # Handler and error logs pick request_id up from the context; the scoped bind
+        # restores the previous values on exit instead of wiping e.g. `service`.
+        with structlog.contextvars.bound_contextvars(request_id=request_id):
+            await self.app(scope, receive, send_with_request_id)
             duration_ms = round((perf_counter() - start) * 1000, 2)
             logger.info(
                 "http_request_completed",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
+                method=scope["method"],
+                path=scope["path"],
+                status_code=status_code,
                 duration_ms=duration_ms,
             )
-        finally:
-            structlog.contextvars.clear_contextvars()
-
-        response.headers["X-Request-ID"] = request_id
-        return response
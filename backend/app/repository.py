@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
-from functools import partial
 from typing import Any, Protocol
 from uuid import UUID, uuid4
 
 import anyio
-from supabase import Client, create_client
+import httpx
 
 from app.config import Settings
 
+_date_prefix_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_date_prefix() -> str:
+    """Return today's ``YYYY/MM/DD`` storage prefix, reformatting only when the UTC day changes."""
+    global _date_prefix_cache
+    now = time.time()
+    day = int(now // 86400)
+    cached_day, prefix = _date_prefix_cache
+    if day != cached_day:
+        # Format the same reading the day key came from, so a midnight rollover can't mismatch.
+        prefix = time.strftime("%Y/%m/%d", time.gmtime(now))
+        _date_prefix_cache = (day, prefix)
+    return prefix
+
 
 class SummaryRepository(Protocol):
     async def check_ready(self) -> None: ...
@@ -28,6 +43,8 @@ class SummaryRepository(Protocol):
 
 
 class SupabaseRepository:
+    """Talks to Supabase PostgREST and Storage over a shared async HTTP client."""
+
     _audio_extensions = {
         "audio/webm": ".webm",
         "audio/ogg": ".ogg",
@@ -37,63 +54,76 @@ class SupabaseRepository:
 
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
-        self._client: Client = create_client(settings.supabase_url, settings.supabase_service_role_key)
+        key = settings.supabase_service_role_key
+        self._http = httpx.AsyncClient(
+            base_url=settings.supabase_url.rstrip("/"),
+            headers={"apikey": key, "Authorization": f"Bearer {key}"},
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+            timeout=httpx.Timeout(10.0),
+        )
 
-    async def _run(self, fn, *args, **kwargs):  # type: ignore[no-untyped-def]
-        call = partial(fn, *args, **kwargs)
-        return await anyio.to_thread.run_sync(call)
+    async def aclose(self) -> None:
+        await self._http.aclose()
 
     async def check_ready(self) -> None:
-        await self._run(self._check_ready_sync)
-
-    def _check_ready_sync(self) -> None:
-        self._client.table("summary_requests").select("id").limit(1).execute()
+        response = await self._http.get("/rest/v1/summary_requests", params={"select": "id", "limit": "1"})
+        response.raise_for_status()
 
     async def create_audio_asset(self, *, data: bytes, content_type: str) -> UUID:
-        return await self._run(self._create_audio_asset_sync, data, content_type)
-
-    def _create_audio_asset_sync(self, data: bytes, content_type: str) -> UUID:
         audio_id = uuid4()
         extension = self._audio_extensions.get(content_type, ".bin")
-        date_prefix = datetime.now(timezone.utc).strftime("%Y/%m/%d")
-        storage_path = f"{date_prefix}/{audio_id}{extension}"
+        storage_path = f"{_utc_date_prefix()}/{audio_id.hex}{extension}"
+
+        # Upload first so an audio_assets row never points at a missing object, and remove
+        # the object again if the row can't be written.
+        await self._upload_audio(storage_path, data, content_type)
+        try:
+            await self._insert_audio_asset(audio_id, storage_path, content_type)
+        except BaseException:
+            with anyio.CancelScope(shield=True):
+                await self._delete_audio(storage_path)
+            raise
+
+        return audio_id
 
-        self._client.storage.from_(self._settings.supabase_storage_bucket).upload(
-            storage_path,
-            data,
-            {"content-type": content_type, "upsert": False},
+    async def _upload_audio(self, storage_path: str, data: bytes, content_type: str) -> None:
+        response = await self._http.post(
+            f"/storage/v1/object/{self._settings.supabase_storage_bucket}/{storage_path}",
+            content=data,
+            headers={"content-type": content_type, "x-upsert": "false"},
         )
+        response.raise_for_status()
 
-        result = (
-            self._client.table("audio_assets")
-            .insert(
-                {
-                    "id": str(audio_id),
-                    "storage_path": storage_path,
-                    "content_type": content_type,
-                }
+    async def _delete_audio(self, storage_path: str) -> None:
+        # Best effort: the original failure is what the caller needs to see.
+        try:
+            response = await self._http.delete(
+                f"/storage/v1/object/{self._settings.supabase_storage_bucket}/{storage_path}"
             )
-            .execute()
+            response.raise_for_status()
+        except httpx.HTTPError:
+            pass
+
+    async def _insert_audio_asset(self, audio_id: UUID, storage_path: str, content_type: str) -> None:
+        response = await self._http.post(
+            "/rest/v1/rpc/create_audio_asset",
+            json={
+                "asset_id": str(audio_id),
+                "asset_storage_path": storage_path,
+                "asset_content_type": content_type,
+            },
         )
-        if not result.data:
+        response.raise_for_status()
+        if not response.json():
             raise RuntimeError("audio_assets insert failed")
 
-        return audio_id
-
     async def create_summary_request(
         self,
         *,
         email: str,
         audio_id: UUID,
         send_at: datetime,
-    ) -> dict[str, Any]:
-        return await self._run(self._create_summary_request_sync, email, audio_id, send_at)
-
-    def _create_summary_request_sync(
-        self,
-        email: str,
-        audio_id: UUID,
-        send_at: datetime,
     ) -> dict[str, Any]:
         payload = {
             "email": email,
@@ -101,8 +131,13 @@ class SupabaseRepository:
             "send_at": send_at.astimezone(timezone.utc).isoformat(),
             "status": "pending",
         }
-        result = self._client.table("summary_requests").insert(payload).execute()
-        data = result.data
+        response = await self._http.post(
+            "/rest/v1/summary_requests",
+            json=payload,
+            headers={"Prefer": "return=representation"},
+        )
+        response.raise_for_status()
+        data = response.json()
         if not data:
             raise RuntimeError("summary_requests insert failed")
         row = data[0] if isinstance(data, list) else data
@@ -113,16 +148,16 @@ class SupabaseRepository:
         }
 
     async def get_summary_request(self, request_id: UUID) -> dict[str, Any] | None:
-        return await self._run(self._get_summary_request_sync, request_id)
-
-    def _get_summary_request_sync(self, request_id: UUID) -> dict[str, Any] | None:
-        result = (
-            self._client.table("summary_requests")
-            .select("id,status,send_at,attempts,last_error,summary_json,transcript_text")
-            .eq("id", str(request_id))
-            .limit(1)
-            .execute()
+        response = await self._http.get(
+            "/rest/v1/summary_requests",
+            params={
+                "select": "id,status,send_at,attempts,last_error,summary_json,transcript_text",
+                "id": f"eq.{request_id}",
+                "limit": "1",
+            },
         )
-        if not result.data:
+        response.raise_for_status()
+        rows = response.json()
+        if not rows:
             return None
-        return result.data[0]
+        return rows[0]
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, field_validator
+
+# Cheap syntactic check only; Mailjet performs authoritative address validation on send.
+EmailAddress = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, max_length=254, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$"),
+]
 
 
 class AudioUploadResponse(BaseModel):
@@ -11,7 +18,7 @@ class AudioUploadResponse(BaseModel):
 
 
 class CreateSummaryRequestInput(BaseModel):
-    email: EmailStr
+    email: EmailAddress
     audio_id: UUID
     send_at: datetime | None = None
 
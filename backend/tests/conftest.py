@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
 import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 
 from app.config import get_settings
 from app.main import create_app
@@ -37,14 +41,22 @@ class FakeRepository:
         return self.requests.get(str(request_id))
 
 
-@pytest.fixture()
-def test_app(monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
-    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "dummy")
-    monkeypatch.setenv("MAX_AUDIO_MB", "1")
+@pytest.fixture(scope="session")
+def test_app() -> Iterator[FastAPI]:
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+        monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "dummy")
+        monkeypatch.setenv("MAX_AUDIO_MB", "1")
+        get_settings.cache_clear()
+
+        app = create_app()
+        fake_repo = FakeRepository()
+        app.state.repository = fake_repo
+        yield app
     get_settings.cache_clear()
 
-    app = create_app()
-    fake_repo = FakeRepository()
-    app.state.repository = fake_repo
-    return app
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(test_app: FastAPI) -> AsyncIterator[AsyncClient]:
+    async with AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test") as session_client:
+        yield session_client
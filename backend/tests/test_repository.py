@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from app.config import Settings
+from app.repository import SupabaseRepository
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_create_audio_asset_removes_object_when_insert_fails() -> None:
+    calls: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        if request.url.path == "/rest/v1/rpc/create_audio_asset":
+            return httpx.Response(500, json={"message": "boom"})
+        return httpx.Response(200, json={})
+
+    settings = Settings(supabase_url="https://example.supabase.co", supabase_service_role_key="dummy", _env_file=None)
+    repo = SupabaseRepository(settings)
+    await repo.aclose()
+    repo._http = httpx.AsyncClient(base_url=settings.supabase_url, transport=httpx.MockTransport(handler))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await repo.create_audio_asset(data=b"audio", content_type="audio/webm")
+    await repo.aclose()
+
+    upload, insert, delete = calls
+    assert upload[0] == "POST" and upload[1].startswith("/storage/v1/object/voice-audio/")
+    assert insert == ("POST", "/rest/v1/rpc/create_audio_asset")
+    assert delete == ("DELETE", upload[1])
@@ -107,3 +107,99 @@ begin
   select * from updated;
 end;
 $$;
+
+create or replace function create_audio_asset(
+  asset_id uuid,
+  asset_storage_path text,
+  asset_content_type text
+)
+returns uuid
+language sql
+as $$
+  insert into audio_assets (id, storage_path, content_type)
+  values (asset_id, asset_storage_path, asset_content_type)
+  returning id;
+$$;
+
+create or replace function notify_summary_request_pending()
+returns trigger
+language plpgsql
+as $$
+begin
+  if new.status = 'pending' then
+    perform pg_notify('summary_requests_new', new.id::text);
+  end if;
+  return new;
+end;
+$$;
+
+drop trigger if exists trg_summary_requests_notify on summary_requests;
+create trigger trg_summary_requests_notify
+after insert or update of status, send_at on summary_requests
+for each row
+-- Future rows are picked up by the worker's seconds_until_next_due timeout; only
+-- wake listeners for rows that are due now.
+when (new.send_at <= now())
+execute function notify_summary_request_pending();
+
+create or replace function complete_request(
+  target_request_id uuid,
+  target_lock_token uuid,
+  result_transcript_id uuid,
+  result_transcript_text text,
+  result_summary_json jsonb,
+  email_provider text,
+  email_message_id text
+)
+returns void
+language plpgsql
+as $$
+begin
+  insert into email_deliveries (request_id, provider, status, message_id, error, sent_at)
+  values (target_request_id, email_provider, 'sent', email_message_id, null, now());
+
+  update summary_requests
+  set
+    status = 'sent',
+    transcript_id = result_transcript_id,
+    transcript_text = result_transcript_text,
+    summary_json = result_summary_json,
+    last_error = null,
+    locked_at = null,
+    lock_token = null
+  where id = target_request_id
+    and lock_token = target_lock_token;
+end;
+$$;
+
+create or replace function fail_request(
+  target_request_id uuid,
+  target_lock_token uuid,
+  failed_attempts int,
+  failure_error text,
+  max_attempts int,
+  email_provider text default null
+)
+returns void
+language plpgsql
+as $$
+begin
+  if email_provider is not null then
+    insert into email_deliveries (request_id, provider, status, message_id, error, sent_at)
+    values (target_request_id, email_provider, 'failed', null, failure_error, null);
+  end if;
+
+  update summary_requests
+  set
+    status = case when failed_attempts < max_attempts then 'pending' else 'failed' end,
+    send_at = case
+      when failed_attempts < max_attempts then now() + make_interval(mins => power(2, failed_attempts)::int)
+      else send_at
+    end,
+    last_error = failure_error,
+    locked_at = null,
+    lock_token = null
+  where id = target_request_id
+    and lock_token = target_lock_token;
+end;
+$$;
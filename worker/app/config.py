@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from pathlib import Path
 
 from pydantic import AliasChoices, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -11,6 +12,9 @@ class WorkerSettings(BaseSettings):
         env_file=(".env", "../.env"),
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
+        validate_assignment=False,
+        populate_by_name=True,
     )
 
     log_level: str = "INFO"
@@ -18,14 +22,24 @@ class WorkerSettings(BaseSettings):
     supabase_url: str
     supabase_service_role_key: str
     supabase_storage_bucket: str = "voice-audio"
+    supabase_db_url: str | None = None
 
     worker_poll_seconds: float = 2.0
+    worker_poll_max_seconds: float = 30.0
     worker_batch_size: int = 10
     worker_max_attempts: int = 3
+    worker_claim_concurrency: int = 4
     supabase_claim_retries: int = 3
     supabase_claim_retry_base_seconds: float = 0.5
 
     whisper_model_size: str = "small"
+    whisper_cpu_threads: int = 0
+    whisper_num_workers: int = 1
+    whisper_compute_type: str = "int8"
+    whisper_beam_size: int = 1
+    transcript_cache_dir: Path | None = None
+    transcript_cache_max_entries: int = 500
+    transcript_cache_max_age_hours: float = 168.0
 
     mailjet_api_key: str = Field(validation_alias=AliasChoices("MAILJET_API_KEY", "MJ_APIKEY_PUBLIC"))
     mailjet_api_secret: str = Field(validation_alias=AliasChoices("MAILJET_API_SECRET", "MJ_APIKEY_PRIVATE"))
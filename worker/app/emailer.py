@@ -4,7 +4,7 @@ import html
 from dataclasses import dataclass
 from typing import Any
 
-import requests
+import httpx
 
 from app.config import WorkerSettings
 
@@ -20,8 +20,27 @@ class EmailSendResult:
 class MailjetEmailSender:
     provider = "mailjet"
 
-    def __init__(self, settings: WorkerSettings) -> None:
+    def __init__(self, settings: WorkerSettings, client: httpx.AsyncClient | None = None) -> None:
         self._settings = settings
+        # One pooled client for the worker's lifetime so sends reuse keep-alive connections.
+        self._owns_client = client is None
+        # HTTP/2 lets a burst of concurrent sends multiplex over one connection.
+        self._client = client or httpx.AsyncClient(http2=True, limits=httpx.Limits(max_keepalive_connections=4))
+        self._auth = (settings.mailjet_api_key, settings.mailjet_api_secret)
+        self._key_hint = self._mask_secret(settings.mailjet_api_key)
+        self._secret_hint = self._mask_secret(settings.mailjet_api_secret)
+        self._send_url = f"{settings.mailjet_base_url.rstrip('/')}/v3.1/send"
+        # Sender, subject and reply-to never change; each send only adds the per-message fields.
+        self._base_message: dict[str, Any] = {
+            "From": {"Email": settings.mailjet_from_email, "Name": settings.mailjet_from_name},
+            "Subject": settings.email_subject,
+        }
+        if settings.email_reply_to:
+            self._base_message["ReplyTo"] = {"Email": settings.email_reply_to}
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
 
     @staticmethod
     def _mask_secret(value: str) -> str:
@@ -29,7 +48,7 @@ class MailjetEmailSender:
             return "*" * len(value)
         return f"{value[:4]}...{value[-4:]}"
 
-    def send_summary_email(
+    async def send_summary_email(
         self,
         recipient: str,
         summary: dict[str, object],
@@ -53,42 +72,33 @@ class MailjetEmailSender:
             "</body></html>"
         )
 
-        message: dict[str, Any] = {
-            "From": {
-                "Email": self._settings.mailjet_from_email,
-                "Name": self._settings.mailjet_from_name,
-            },
+        message = {
+            **self._base_message,
             "To": [{"Email": recipient}],
-            "Subject": self._settings.email_subject,
             "TextPart": text_part,
             "HTMLPart": html_part,
         }
         if request_id:
             message["CustomID"] = request_id
-        if self._settings.email_reply_to:
-            message["ReplyTo"] = {"Email": self._settings.email_reply_to}
 
         payload = {"Messages": [message]}
-        url = f"{self._settings.mailjet_base_url.rstrip('/')}/v3.1/send"
 
         try:
-            response = requests.post(
-                url,
-                auth=(self._settings.mailjet_api_key, self._settings.mailjet_api_secret),
+            response = await self._client.post(
+                self._send_url,
+                auth=self._auth,
                 json=payload,
                 timeout=self._settings.mailjet_timeout_seconds,
             )
-        except requests.RequestException as exc:
+        except httpx.HTTPError as exc:
             raise RuntimeError(f"Mailjet transport failure: {exc}") from exc
         if response.status_code >= 400:
             if response.status_code == 401:
-                key_hint = self._mask_secret(self._settings.mailjet_api_key)
-                secret_hint = self._mask_secret(self._settings.mailjet_api_secret)
                 raise RuntimeError(
                     "Mailjet authentication failed (401). "
                     "Verify MAILJET_API_KEY/MAILJET_API_SECRET are active Send API keys "
                     "(not SMTP credentials), belong to the same account, and contain no whitespace. "
-                    f"key={key_hint}, secret={secret_hint}"
+                    f"key={self._key_hint}, secret={self._secret_hint}"
                 )
             raise RuntimeError(
                 f"Mailjet send failed with status {response.status_code}: {response.text[:400]}"
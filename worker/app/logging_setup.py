@@ -5,36 +5,42 @@ import logging
 import logging.handlers
 import queue
 import sys
-from copy import copy
 from typing import Any
 
+import orjson
 import structlog
 
 _listener: logging.handlers.QueueListener | None = None
 _configured = False
 
 
-class PreservingQueueHandler(logging.handlers.QueueHandler):
-    """Keep structured log records intact for ProcessorFormatter in listener thread."""
+def _orjson_dumps(value: Any, **kwargs: Any) -> str:
+    return orjson.dumps(value, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class FormattingQueueHandler(logging.handlers.QueueHandler):
+    """Render the JSON line before enqueueing so the listener thread only writes it."""
 
     def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
-        return copy(record)
+        # The root logger has no other handlers, so the record can be reused in place
+        # instead of copied the way the stdlib QueueHandler does.
+        record.msg = self.format(record)
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+        return record
 
 
-def configure_logging(service: str, level: str = "INFO") -> None:
+def configure_logging(service: str, level: str = "INFO", include_callsite: bool = False) -> None:
     global _configured, _listener
     if _configured:
         return
 
     log_queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
 
-    root_logger = logging.getLogger()
-    root_logger.handlers.clear()
-    root_logger.setLevel(level.upper())
-    root_logger.addHandler(PreservingQueueHandler(log_queue))
-
     formatter = structlog.stdlib.ProcessorFormatter(
-        processor=structlog.processors.JSONRenderer(),
+        processor=structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         foreign_pre_chain=[
             structlog.processors.TimeStamper(fmt="iso", utc=True),
             structlog.stdlib.add_log_level,
@@ -42,29 +48,42 @@ def configure_logging(service: str, level: str = "INFO") -> None:
         ],
     )
 
+    queue_handler = FormattingQueueHandler(log_queue)
+    queue_handler.setFormatter(formatter)
+
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.setLevel(level.upper())
+    root_logger.addHandler(queue_handler)
+
     sink = logging.StreamHandler(sys.stdout)
-    sink.setFormatter(formatter)
 
     _listener = logging.handlers.QueueListener(log_queue, sink, respect_handler_level=True)
     _listener.start()
     atexit.register(_listener.stop)
 
-    structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.TimeStamper(fmt="iso", utc=True),
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
+    processors: list[structlog.types.Processor] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+    ]
+    if include_callsite:
+        # Walks the stack on every event; only worth it when debugging.
+        processors.append(
             structlog.processors.CallsiteParameterAdder(
                 parameters=[
                     structlog.processors.CallsiteParameter.FILENAME,
                     structlog.processors.CallsiteParameter.LINENO,
                 ]
-            ),
-            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-        ],
+            )
+        )
+    processors.append(structlog.stdlib.ProcessorFormatter.wrap_for_formatter)
+
+    structlog.configure(
+        processors=processors,
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
         cache_logger_on_first_use=True,
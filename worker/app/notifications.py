@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Any
+
+import anyio
+import asyncpg
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+REQUESTS_CHANNEL = "summary_requests_new"
+RECONNECT_MIN_SECONDS = 1.0
+RECONNECT_MAX_SECONDS = 60.0
+
+_CONNECTION_ERRORS = (OSError, asyncpg.InterfaceError, asyncpg.PostgresConnectionError)
+
+
+class PostgresRequestNotifier:
+    """Wakes the worker on `summary_requests_new` notifications instead of fixed polling.
+
+    If the LISTEN connection drops, the worker falls back to plain polling while the
+    notifier reconnects with exponential backoff.
+    """
+
+    def __init__(self, dsn: str, channel: str = REQUESTS_CHANNEL) -> None:
+        self._dsn = dsn
+        self._channel = channel
+        self._conn: asyncpg.Connection | None = None
+        self._event = anyio.Event()
+        self._reconnect_delay = RECONNECT_MIN_SECONDS
+        self._next_reconnect_at = 0.0
+
+    async def connect(self) -> None:
+        conn = await asyncpg.connect(self._dsn)
+        try:
+            await conn.add_listener(self._channel, self._on_notify)
+        except BaseException:
+            conn.terminate()
+            raise
+        self._conn = conn
+        self._reconnect_delay = RECONNECT_MIN_SECONDS
+        logger.info("listening_for_requests", channel=self._channel)
+
+    async def aclose(self) -> None:
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    def _on_notify(self, _conn: Any, _pid: int, _channel: str, _payload: str) -> None:
+        # Stays set until the next wait() consumes it, so a notification that lands
+        # while a batch is being processed is not lost.
+        self._event.set()
+
+    def _discard_connection(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.terminate()
+        self._next_reconnect_at = anyio.current_time() + self._reconnect_delay
+
+    async def _connection(self) -> asyncpg.Connection | None:
+        if self._conn is not None and not self._conn.is_closed():
+            return self._conn
+        if self._conn is not None:
+            logger.warning("notifier_connection_lost", channel=self._channel)
+            self._discard_connection()
+        if anyio.current_time() < self._next_reconnect_at:
+            return None
+
+        try:
+            await self.connect()
+        except _CONNECTION_ERRORS as exc:
+            self._next_reconnect_at = anyio.current_time() + self._reconnect_delay
+            logger.warning("notifier_reconnect_failed", retry_in=self._reconnect_delay, error=str(exc))
+            self._reconnect_delay = min(self._reconnect_delay * 2, RECONNECT_MAX_SECONDS)
+            return None
+        # Notifications sent while we were disconnected are gone; poll once to catch up.
+        self._event.set()
+        return self._conn
+
+    async def seconds_until_next_due(self) -> float | None:
+        conn = await self._connection()
+        if conn is None:
+            return None
+        try:
+            value = await conn.fetchval(
+                "select extract(epoch from (min(send_at) - now())) from summary_requests where status = 'pending'"
+            )
+        except _CONNECTION_ERRORS as exc:
+            logger.warning("notifier_query_failed", error=str(exc))
+            self._discard_connection()
+            return None
+        return float(value) if value is not None else None
+
+    async def wait(self, timeout: float) -> bool:
+        # Without a live connection no NOTIFY can arrive, so this degrades to a plain sleep.
+        notified = False
+        with anyio.move_on_after(max(0.0, timeout)):
+            await self._event.wait()
+            notified = True
+        if self._event.is_set():
+            self._event = anyio.Event()
+        return notified
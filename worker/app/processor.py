@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
 from time import perf_counter
 from uuid import UUID
@@ -9,6 +10,7 @@ import structlog
 
 from app.config import WorkerSettings
 from app.emailer import MailjetEmailSender
+from app.notifications import PostgresRequestNotifier
 from app.repository import SupabaseWorkerRepository
 from app.summarizer import DeterministicSummarizer
 from app.transcriber import WhisperTranscriber
@@ -16,6 +18,8 @@ from app.types import ClaimedRequest
 
 logger = structlog.get_logger(__name__)
 
+_RETRY_MEMO_SIZE = 1024
+
 
 class WorkerProcessor:
     def __init__(
@@ -26,121 +30,172 @@ class WorkerProcessor:
         transcriber: WhisperTranscriber,
         summarizer: DeterministicSummarizer,
         emailer: MailjetEmailSender,
+        notifier: PostgresRequestNotifier | None = None,
     ) -> None:
         self._settings = settings
         self._repository = repository
         self._transcriber = transcriber
         self._summarizer = summarizer
         self._emailer = emailer
+        self._notifier = notifier
+        self._claim_limiter = anyio.CapacityLimiter(max(1, settings.worker_claim_concurrency))
+        # Whisper is CPU-bound and already multi-threaded; run one transcription at a time.
+        self._transcribe_limiter = anyio.CapacityLimiter(1)
+        self._empty_polls = 0
+        # Transcript and summary from a request's failed attempt, keyed by request id, so a
+        # retry (e.g. after a Mailjet error) skips download, transcription and summarizing.
+        # Dropped once the request is sent; a sent row is never claimed again.
+        self._retry_memo: OrderedDict[UUID, tuple[str, UUID | None, dict[str, object]]] = OrderedDict()
 
     async def run_forever(self) -> None:
         logger.info("worker_started", poll_seconds=self._settings.worker_poll_seconds)
         while True:
             cycle_started = perf_counter()
+            claimed = 0
             try:
-                await self.process_once()
+                claimed = await self.process_once()
             except Exception as exc:
                 logger.exception("worker_cycle_failed", error=str(exc))
             logger.info("worker_cycle_done", duration_ms=round((perf_counter() - cycle_started) * 1000, 2))
-            await anyio.sleep(self._settings.worker_poll_seconds)
+            await self._wait_for_work(self._next_poll_seconds(claimed))
 
-    async def process_once(self) -> None:
-        claim_started = perf_counter()
-        claims = await self._repository.claim_due_requests(self._settings.worker_batch_size)
-        logger.info(
-            "claimed_due_requests",
-            count=len(claims),
-            duration_ms=round((perf_counter() - claim_started) * 1000, 2),
-        )
+    def _next_poll_seconds(self, claimed: int) -> float:
+        # Back off exponentially while polls come back empty, and snap back to the
+        # base interval as soon as a cycle finds work.
+        base = self._settings.worker_poll_seconds
+        if claimed:
+            self._empty_polls = 0
+            return base
+        ceiling = max(base, self._settings.worker_poll_max_seconds)
+        delay = min(base * 2**self._empty_polls, ceiling)
+        if delay < ceiling:
+            self._empty_polls += 1
+        return delay
 
-        for claim in claims:
-            await self._process_claim(claim)
+    async def _wait_for_work(self, poll_seconds: float) -> None:
+        if self._notifier is None:
+            await anyio.sleep(poll_seconds)
+            return
 
-    async def _process_claim(self, claim: ClaimedRequest) -> None:
-        structlog.contextvars.clear_contextvars()
-        structlog.contextvars.bind_contextvars(request_id=str(claim.id), job_id=str(claim.id))
-
-        started = perf_counter()
-        email_attempted = False
+        # Sleep until the earliest pending send_at, a NOTIFY for a new/rescheduled
+        # request, or the poll interval as a safety net, whichever comes first.
         try:
-            transcript_text, transcript_id = await self._resolve_transcript(claim)
+            timeout = poll_seconds
+            due_in = await self._notifier.seconds_until_next_due()
+            # Only a future send_at may shorten the wait: an overdue row was just polled
+            # and not claimed, so waking for it again would spin instead of backing off.
+            if due_in is not None and due_in > 0:
+                timeout = min(timeout, due_in)
+            notified = await self._notifier.wait(timeout)
+        except Exception as exc:
+            logger.exception("worker_wait_failed", error=str(exc))
+            await anyio.sleep(poll_seconds)
+            return
+        if notified:
+            logger.info("worker_notified")
 
-            summary_started = perf_counter()
-            summary = self._summarizer.summarize(transcript_text)
+    async def process_once(self) -> int:
+        batch_size = self._settings.worker_batch_size
+        total = 0
+        # Keep claiming while batches come back full so a backlog drains at processing
+        # speed rather than one batch per poll interval.
+        while True:
+            claim_started = perf_counter()
+            claims = await self._repository.claim_due_requests(batch_size)
+            count = len(claims)
             logger.info(
-                "summary_generated",
-                duration_ms=round((perf_counter() - summary_started) * 1000, 2),
-                bullet_count=len(summary.get("bullets", [])),
+                "claimed_due_requests",
+                count=count,
+                duration_ms=round((perf_counter() - claim_started) * 1000, 2),
             )
+            async with anyio.create_task_group() as tg:
+                for claim in claims:
+                    tg.start_soon(self._guarded_process_claim, claim)
+            total += count
 
-            email_started = perf_counter()
-            email_attempted = True
-            send_result = await anyio.to_thread.run_sync(
-                self._emailer.send_summary_email,
-                claim.email,
-                summary,
-                str(claim.id),
-            )
-            logger.info(
-                "email_sent",
-                message_id=send_result.message_id,
-                provider_status=send_result.provider_status,
-                recipient_state=send_result.recipient_state,
-                message_href=send_result.message_href,
-                duration_ms=round((perf_counter() - email_started) * 1000, 2),
-            )
+            if count < batch_size:
+                return total
 
-            await self._repository.insert_email_delivery(
-                request_id=claim.id,
-                provider=self._emailer.provider,
-                status="sent",
-                message_id=send_result.message_id,
-                error=None,
-            )
+    async def _guarded_process_claim(self, claim: ClaimedRequest) -> None:
+        async with self._claim_limiter:
+            try:
+                await self._process_claim(claim)
+            except Exception as exc:
+                # Never let one claim's bookkeeping failure cancel its siblings mid-flight.
+                logger.exception("claim_processing_crashed", request_id=claim.id_str, error=str(exc))
 
-            await self._repository.mark_sent(
-                request_id=claim.id,
-                lock_token=claim.lock_token,
-                transcript_id=transcript_id,
-                transcript_text=transcript_text,
-                summary_json=summary,
-            )
+    async def _process_claim(self, claim: ClaimedRequest) -> None:
+        # Scoped bind: pops only these keys on exit, so `service` and sibling tasks are untouched.
+        with structlog.contextvars.bound_contextvars(request_id=claim.id_str, job_id=claim.id_str):
+            started = perf_counter()
+            email_attempted = False
+            try:
+                memo = self._retry_memo.get(claim.id)
+                if memo is not None:
+                    transcript_text, transcript_id, summary = memo
+                    logger.info("reusing_previous_attempt", bullet_count=len(summary.get("bullets", [])))
+                else:
+                    transcript_text, transcript_id = await self._resolve_transcript(claim)
 
-            logger.info(
-                "request_completed",
-                status="sent",
-                attempts=claim.attempts,
-                duration_ms=round((perf_counter() - started) * 1000, 2),
-            )
-        except Exception as exc:
-            error_message = str(exc)
-            logger.exception(
-                "request_failed",
-                error=error_message,
-                attempts=claim.attempts,
-                duration_ms=round((perf_counter() - started) * 1000, 2),
-            )
-            if email_attempted:
-                try:
-                    await self._repository.insert_email_delivery(
-                        request_id=claim.id,
-                        provider=self._emailer.provider,
-                        status="failed",
-                        message_id=None,
-                        error=error_message,
+                    summary_started = perf_counter()
+                    summary = self._summarizer.summarize(transcript_text)
+                    logger.info(
+                        "summary_generated",
+                        duration_ms=round((perf_counter() - summary_started) * 1000, 2),
+                        bullet_count=len(summary.get("bullets", [])),
                     )
-                except Exception:
-                    logger.exception("email_delivery_failure_record_failed")
-
-            await self._repository.handle_failure(
-                request_id=claim.id,
-                lock_token=claim.lock_token,
-                attempts=claim.attempts,
-                error_message=error_message,
-                max_attempts=self._settings.worker_max_attempts,
-            )
-        finally:
-            structlog.contextvars.clear_contextvars()
+                    self._remember_attempt(claim.id, (transcript_text, transcript_id, summary))
+
+                email_started = perf_counter()
+                email_attempted = True
+                send_result = await self._emailer.send_summary_email(claim.email, summary, claim.id_str)
+                logger.info(
+                    "email_sent",
+                    message_id=send_result.message_id,
+                    provider_status=send_result.provider_status,
+                    recipient_state=send_result.recipient_state,
+                    message_href=send_result.message_href,
+                    duration_ms=round((perf_counter() - email_started) * 1000, 2),
+                )
+
+                await self._repository.complete_sent(
+                    request_id=claim.id_str,
+                    lock_token=claim.lock_token_str,
+                    transcript_id=transcript_id,
+                    transcript_text=transcript_text,
+                    summary_json=summary,
+                    provider=self._emailer.provider,
+                    message_id=send_result.message_id,
+                )
+                self._retry_memo.pop(claim.id, None)
+
+                logger.info(
+                    "request_completed",
+                    status="sent",
+                    attempts=claim.attempts,
+                    duration_ms=round((perf_counter() - started) * 1000, 2),
+                )
+            except Exception as exc:
+                error_message = str(exc)
+                logger.exception(
+                    "request_failed",
+                    error=error_message,
+                    attempts=claim.attempts,
+                    duration_ms=round((perf_counter() - started) * 1000, 2),
+                )
+                await self._repository.handle_failure(
+                    request_id=claim.id_str,
+                    lock_token=claim.lock_token_str,
+                    attempts=claim.attempts,
+                    error_message=error_message,
+                    max_attempts=self._settings.worker_max_attempts,
+                    email_provider=self._emailer.provider if email_attempted else None,
+                )
+
+    def _remember_attempt(self, request_id: UUID, result: tuple[str, UUID | None, dict[str, object]]) -> None:
+        self._retry_memo[request_id] = result
+        if len(self._retry_memo) > _RETRY_MEMO_SIZE:
+            self._retry_memo.popitem(last=False)
 
     async def _resolve_transcript(self, claim: ClaimedRequest) -> tuple[str, UUID | None]:
         if claim.raw_transcript and claim.raw_transcript.strip():
@@ -181,6 +236,7 @@ class WorkerProcessor:
             self._transcriber.transcribe_bytes,
             audio_bytes,
             suffix,
+            limiter=self._transcribe_limiter,
         )
         if not transcript_text.strip():
             raise RuntimeError("Transcriber returned empty transcript")
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
 from functools import partial
-import time
 from typing import Any
 from uuid import UUID
 
@@ -10,65 +8,110 @@ import anyio
 import httpx
 import structlog
 from supabase import Client, create_client
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from app.config import WorkerSettings
 from app.types import ClaimedRequest
 
 logger = structlog.get_logger(__name__)
 
+_TRANSIENT_ERRORS = (httpx.TransportError, httpx.TimeoutException)
+# Audio objects can be large; set per call so a shared client's default doesn't apply.
+_DOWNLOAD_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+def _parse_claim(row: dict[str, Any]) -> ClaimedRequest:
+    return ClaimedRequest(
+        id=UUID(row["id"]),
+        email=row["email"],
+        audio_id=UUID(row["audio_id"]) if row.get("audio_id") else None,
+        transcript_id=UUID(row["transcript_id"]) if row.get("transcript_id") else None,
+        raw_transcript=row.get("raw_transcript"),
+        lock_token=UUID(row["lock_token"]),
+        attempts=int(row["attempts"]),
+        id_str=row["id"],
+        lock_token_str=row["lock_token"],
+    )
+
 
 class SupabaseWorkerRepository:
-    def __init__(self, settings: WorkerSettings, client: Client | None = None) -> None:
+    def __init__(
+        self,
+        settings: WorkerSettings,
+        client: Client | None = None,
+        http: httpx.AsyncClient | None = None,
+    ) -> None:
         self._settings = settings
-        self._client: Client = client or create_client(settings.supabase_url, settings.supabase_service_role_key)
+        key = settings.supabase_service_role_key
+        self._storage_url = f"{settings.supabase_url.rstrip('/')}/storage/v1/object/{settings.supabase_storage_bucket}"
+        self._storage_headers = {"apikey": key, "Authorization": f"Bearer {key}"}
+        self._owns_http = http is None
+        self._http = http or httpx.AsyncClient()
+        self._owns_client = client is None
+        self._client: Client = client or self._create_client()
+
+    async def aclose(self) -> None:
+        # Only close what this repository created; injected clients belong to the caller.
+        if self._owns_http:
+            await self._http.aclose()
+        if self._owns_client:
+            self._client.postgrest.aclose()
+
+    def _create_client(self) -> Client:
+        return create_client(self._settings.supabase_url, self._settings.supabase_service_role_key)
+
+    def _reset_client(self) -> None:
+        # Sub-clients are built lazily, so a fresh client only opens the connections it uses.
+        if not self._owns_client:
+            return
+        stale, self._client = self._client, self._create_client()
+        stale.postgrest.aclose()
 
     async def _run(self, fn, *args, **kwargs):  # type: ignore[no-untyped-def]
         call = partial(fn, *args, **kwargs)
         return await anyio.to_thread.run_sync(call)
 
     async def claim_due_requests(self, batch_size: int) -> list[ClaimedRequest]:
-        return await self._run(self._claim_due_requests_sync, batch_size)
+        return [_parse_claim(row) for row in await self._claim_due_rows(batch_size)]
 
-    def _claim_due_requests_sync(self, batch_size: int) -> list[ClaimedRequest]:
+    async def _claim_due_rows(self, batch_size: int) -> list[dict[str, Any]]:
         max_retries = max(1, self._settings.supabase_claim_retries)
         base_delay = max(0.1, self._settings.supabase_claim_retry_base_seconds)
+        # Backoff sleeps on the event loop instead of parking a worker thread.
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(max_retries),
+            wait=wait_exponential_jitter(initial=base_delay, jitter=base_delay),
+            retry=retry_if_exception_type(_TRANSIENT_ERRORS),
+            before_sleep=self._before_claim_retry,
+            sleep=anyio.sleep,
+            reraise=True,
+        )
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    return await self._run(self._claim_due_rows_sync, batch_size)
+        except _TRANSIENT_ERRORS as exc:
+            logger.warning(
+                "claim_due_requests_transport_unavailable",
+                attempt=max_retries,
+                max_retries=max_retries,
+                error=str(exc),
+            )
+        return []
 
-        for attempt in range(1, max_retries + 1):
-            try:
-                result = self._client.rpc("claim_due_requests", {"batch_size": batch_size}).execute()
-                rows = result.data or []
-                claimed: list[ClaimedRequest] = []
-                for row in rows:
-                    claimed.append(
-                        ClaimedRequest(
-                            id=UUID(row["id"]),
-                            email=row["email"],
-                            audio_id=UUID(row["audio_id"]) if row.get("audio_id") else None,
-                            transcript_id=UUID(row["transcript_id"]) if row.get("transcript_id") else None,
-                            raw_transcript=row.get("raw_transcript"),
-                            lock_token=UUID(row["lock_token"]),
-                            attempts=int(row["attempts"]),
-                        )
-                    )
-                return claimed
-            except (httpx.TransportError, httpx.TimeoutException) as exc:
-                if attempt >= max_retries:
-                    logger.warning(
-                        "claim_due_requests_transport_unavailable",
-                        attempt=attempt,
-                        max_retries=max_retries,
-                        error=str(exc),
-                    )
-                    return []
-
-                # Refresh client to avoid reusing a broken connection.
-                self._client = create_client(
-                    self._settings.supabase_url,
-                    self._settings.supabase_service_role_key,
-                )
-                time.sleep(base_delay * (2 ** (attempt - 1)))
+    def _before_claim_retry(self, retry_state: RetryCallState) -> None:
+        # Drop pooled connections so the retry doesn't reuse a broken one.
+        self._reset_client()
 
-        return []
+    def _claim_due_rows_sync(self, batch_size: int) -> list[dict[str, Any]]:
+        result = self._client.rpc("claim_due_requests", {"batch_size": batch_size}).execute()
+        return result.data or []
 
     async def get_transcript_text(self, transcript_id: UUID) -> str | None:
         return await self._run(self._get_transcript_text_sync, transcript_id)
@@ -101,13 +144,17 @@ class SupabaseWorkerRepository:
         return result.data[0]
 
     async def download_audio_bytes(self, storage_path: str) -> bytes:
-        return await self._run(self._download_audio_bytes_sync, storage_path)
-
-    def _download_audio_bytes_sync(self, storage_path: str) -> bytes:
-        data = self._client.storage.from_(self._settings.supabase_storage_bucket).download(storage_path)
-        if not data:
+        # Straight from the Storage REST API on the shared async client, rather than
+        # holding a worker thread for the whole transfer.
+        response = await self._http.get(
+            f"{self._storage_url}/{storage_path}",
+            headers=self._storage_headers,
+            timeout=_DOWNLOAD_TIMEOUT,
+        )
+        response.raise_for_status()
+        if not response.content:
             raise RuntimeError("Downloaded audio is empty")
-        return data
+        return response.content
 
     async def insert_transcript(self, *, audio_id: UUID, text: str, provider: str) -> UUID:
         return await self._run(self._insert_transcript_sync, audio_id, text, provider)
@@ -122,93 +169,59 @@ class SupabaseWorkerRepository:
         row = data[0] if isinstance(data, list) else data
         return UUID(row["id"])
 
-    async def mark_sent(
+    async def complete_sent(
         self,
         *,
-        request_id: UUID,
-        lock_token: UUID,
+        request_id: str,
+        lock_token: str,
         transcript_id: UUID | None,
         transcript_text: str,
         summary_json: dict[str, Any],
+        provider: str,
+        message_id: str,
     ) -> None:
         await self._run(
-            self._mark_sent_sync,
+            self._complete_sent_sync,
             request_id,
             lock_token,
             transcript_id,
             transcript_text,
             summary_json,
+            provider,
+            message_id,
         )
 
-    def _mark_sent_sync(
+    def _complete_sent_sync(
         self,
-        request_id: UUID,
-        lock_token: UUID,
+        request_id: str,
+        lock_token: str,
         transcript_id: UUID | None,
         transcript_text: str,
         summary_json: dict[str, Any],
-    ) -> None:
-        payload = {
-            "status": "sent",
-            "transcript_id": str(transcript_id) if transcript_id else None,
-            "transcript_text": transcript_text,
-            "summary_json": summary_json,
-            "last_error": None,
-            "locked_at": None,
-            "lock_token": None,
-        }
-        (
-            self._client.table("summary_requests")
-            .update(payload)
-            .eq("id", str(request_id))
-            .eq("lock_token", str(lock_token))
-            .execute()
-        )
-
-    async def insert_email_delivery(
-        self,
-        *,
-        request_id: UUID,
-        provider: str,
-        status: str,
-        message_id: str | None,
-        error: str | None,
-    ) -> None:
-        await self._run(
-            self._insert_email_delivery_sync,
-            request_id,
-            provider,
-            status,
-            message_id,
-            error,
-        )
-
-    def _insert_email_delivery_sync(
-        self,
-        request_id: UUID,
         provider: str,
-        status: str,
-        message_id: str | None,
-        error: str | None,
+        message_id: str,
     ) -> None:
-        payload = {
-            "request_id": str(request_id),
-            "provider": provider,
-            "status": status,
-            "message_id": message_id,
-            "error": error,
-            "sent_at": datetime.now(timezone.utc).isoformat() if status == "sent" else None,
+        # Delivery row and status flip commit together in one round-trip.
+        params = {
+            "target_request_id": request_id,
+            "target_lock_token": lock_token,
+            "result_transcript_id": str(transcript_id) if transcript_id else None,
+            "result_transcript_text": transcript_text,
+            "result_summary_json": summary_json,
+            "email_provider": provider,
+            "email_message_id": message_id,
         }
-        self._client.table("email_deliveries").insert(payload).execute()
+        self._client.rpc("complete_request", params).execute()
 
     async def handle_failure(
         self,
         *,
-        request_id: UUID,
-        lock_token: UUID,
+        request_id: str,
+        lock_token: str,
         attempts: int,
         error_message: str,
         max_attempts: int,
+        email_provider: str | None = None,
     ) -> None:
         await self._run(
             self._handle_failure_sync,
@@ -217,38 +230,26 @@ class SupabaseWorkerRepository:
             attempts,
             error_message,
             max_attempts,
+            email_provider,
         )
 
     def _handle_failure_sync(
         self,
-        request_id: UUID,
-        lock_token: UUID,
+        request_id: str,
+        lock_token: str,
         attempts: int,
         error_message: str,
         max_attempts: int,
+        email_provider: str | None,
     ) -> None:
-        safe_error = error_message[:2000]
-        if attempts < max_attempts:
-            retry_time = datetime.now(timezone.utc) + timedelta(minutes=(2**attempts))
-            payload = {
-                "status": "pending",
-                "send_at": retry_time.isoformat(),
-                "last_error": safe_error,
-                "locked_at": None,
-                "lock_token": None,
-            }
-        else:
-            payload = {
-                "status": "failed",
-                "last_error": safe_error,
-                "locked_at": None,
-                "lock_token": None,
-            }
-
-        (
-            self._client.table("summary_requests")
-            .update(payload)
-            .eq("id", str(request_id))
-            .eq("lock_token", str(lock_token))
-            .execute()
-        )
+        # fail_request records the failed delivery (when an email was attempted) and
+        # reschedules with 2**attempts minutes of backoff, or marks the request failed.
+        params = {
+            "target_request_id": request_id,
+            "target_lock_token": lock_token,
+            "failed_attempts": attempts,
+            "failure_error": error_message[:2000],
+            "max_attempts": max_attempts,
+            "email_provider": email_provider,
+        }
+        self._client.rpc("fail_request", params).execute()
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
 import re
-from collections import Counter
+from collections import OrderedDict
 
+import numpy as np
 
-class DeterministicSummarizer:
-    _stop_words = {
+_WS_RE = re.compile(r"\s+")
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+_TOKEN_RE = re.compile(r"[a-zA-Z']+")
+_CLAUSE_RE = re.compile(r"[.;,:!?]\s+|\s+-\s+")
+# Substring match, as before: "planning" and "actionable" still count.
+_NEXT_STEP_RE = re.compile(r"next|follow up|action|todo|need to|plan|should")
+
+_STOP = frozenset(
+    {
         "a",
         "an",
         "and",
@@ -35,13 +45,38 @@ class DeterministicSummarizer:
         "you",
         "your",
     }
+)
+
+
+def _copy_summary(summary: dict[str, object]) -> dict[str, object]:
+    return {"bullets": list(summary["bullets"]), "next_step": summary["next_step"]}  # type: ignore[call-overload]
+
 
-    def __init__(self, max_bullets: int = 5) -> None:
+class DeterministicSummarizer:
+    def __init__(self, max_bullets: int = 5, cache_size: int = 256) -> None:
         self._max_bullets = max(3, min(5, max_bullets))
         self._max_bullet_words = 22
         self._max_next_step_words = 18
+        self._cache_size = cache_size
+        self._cache: OrderedDict[bytes, dict[str, object]] = OrderedDict()
 
     def summarize(self, transcript: str) -> dict[str, object]:
+        # Summaries are a pure function of the text, so retries and duplicate
+        # deliveries can reuse the previous result.
+        key = hashlib.blake2b(transcript.encode("utf-8"), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return _copy_summary(cached)
+
+        summary = self._summarize(transcript)
+        if self._cache_size > 0:
+            self._cache[key] = _copy_summary(summary)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return summary
+
+    def _summarize(self, transcript: str) -> dict[str, object]:
         cleaned = self._normalize_text(transcript)
         if not cleaned:
             return {
@@ -62,38 +97,45 @@ class DeterministicSummarizer:
         return {"bullets": bullets, "next_step": next_step}
 
     def _normalize_text(self, text: str) -> str:
-        return re.sub(r"\s+", " ", text).strip()
+        return _WS_RE.sub(" ", text).strip()
 
     def _split_sentences(self, text: str) -> list[str]:
-        pieces = re.split(r"(?<=[.!?])\s+", text)
+        pieces = _SENT_RE.split(text)
         sentences = [piece.strip() for piece in pieces if piece.strip()]
         return sentences
 
     def _tokenize(self, text: str) -> list[str]:
-        return re.findall(r"[a-zA-Z']+", text.lower())
-
-    def _score_sentence(self, sentence: str, frequencies: Counter[str]) -> float:
-        words = [word for word in self._tokenize(sentence) if word not in self._stop_words]
-        if not words:
-            return 0.0
-        return sum(frequencies[word] for word in words) / len(words)
+        return _TOKEN_RE.findall(text.lower())
+
+    def _score_sentences(self, sentence_tokens: list[list[str]]) -> list[float]:
+        # Each sentence scores the mean corpus frequency of its words. Map words to ids,
+        # count them with bincount, and sum each sentence's slice via a cumulative sum.
+        vocabulary: dict[str, int] = {}
+        ids = np.fromiter(
+            (vocabulary.setdefault(word, len(vocabulary)) for words in sentence_tokens for word in words),
+            dtype=np.intp,
+        )
+        lengths = np.fromiter((len(words) for words in sentence_tokens), dtype=np.intp, count=len(sentence_tokens))
+        frequencies = np.bincount(ids, minlength=len(vocabulary))
+        totals = np.concatenate(([0], np.cumsum(frequencies[ids])))
+        ends = np.cumsum(lengths)
+        sums = totals[ends] - totals[ends - lengths]
+        scores = np.divide(sums, lengths, out=np.zeros(len(lengths)), where=lengths > 0)
+        return scores.tolist()
 
     def _select_bullets(self, text: str, sentences: list[str]) -> list[str]:
         if len(sentences) >= 3:
-            tokens = [word for word in self._tokenize(text) if word not in self._stop_words]
-            frequencies = Counter(tokens)
-            scored = [
-                (index, sentence, self._score_sentence(sentence, frequencies))
-                for index, sentence in enumerate(sentences)
+            sentence_tokens = [
+                [word for word in self._tokenize(sentence) if word not in _STOP] for sentence in sentences
             ]
-            scored.sort(key=lambda item: (-item[2], item[0]))
+            scores = self._score_sentences(sentence_tokens)
 
             target_count = min(self._max_bullets, len(sentences))
             target_count = max(3, min(target_count, 5))
-            top = scored[:target_count]
-            top.sort(key=lambda item: item[0])
-            bullets = [item[1] for item in top]
-            return bullets[:5]
+            # nlargest is stable, so equal scores keep the earliest sentence first.
+            top = heapq.nlargest(target_count, range(len(sentences)), key=scores.__getitem__)
+            top.sort()
+            return [sentences[index] for index in top][:5]
 
         clauses = self._extract_clauses(text)
         if not clauses:
@@ -101,17 +143,15 @@ class DeterministicSummarizer:
         return clauses[: min(self._max_bullets, 5)]
 
     def _derive_next_step(self, sentences: list[str], bullets: list[str]) -> str:
-        keywords = ("next", "follow up", "action", "todo", "need to", "plan", "should")
         for sentence in sentences:
-            lower = sentence.lower()
-            if any(keyword in lower for keyword in keywords):
+            if _NEXT_STEP_RE.search(sentence.lower()):
                 return sentence
         if bullets:
             return f"Take action on: {bullets[0]}"
         return "Review the transcript and choose one concrete follow-up action."
 
     def _extract_clauses(self, text: str) -> list[str]:
-        parts = re.split(r"[.;,:!?]\s+|\s+-\s+", text)
+        parts = _CLAUSE_RE.split(text)
         clauses: list[str] = []
         for part in parts:
             candidate = part.strip()
@@ -1,36 +1,203 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import json
 import os
 import tempfile
+import time
+from functools import cache
 from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
 
+import numpy as np
+import structlog
 from faster_whisper import WhisperModel
+from faster_whisper.transcribe import Segment
+
+logger = structlog.get_logger(__name__)
+
+NO_CACHE_ENV = "AUDIO_SUMMARY_NO_TRANSCRIPT_CACHE"
+DEFAULT_CACHE_MAX_ENTRIES = 500
+DEFAULT_CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600.0
+_VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
+
+def default_cache_dir() -> Path | None:
+    if os.environ.get(NO_CACHE_ENV, "").strip().lower() in {"1", "true", "yes"}:
+        return None
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "audio-summary-agent" / "transcripts"
+
+
+@cache
+def _load_whisper_model(model_size: str, compute_type: str, cpu_threads: int, num_workers: int) -> WhisperModel:
+    # Process-wide, so a restarted processor or a second transcriber reuses the loaded weights.
+    return WhisperModel(
+        model_size,
+        device="cpu",
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+    )
 
 
 class WhisperTranscriber:
     provider = "faster-whisper"
 
-    def __init__(self, model_size: str = "small") -> None:
+    def __init__(
+        self,
+        model_size: str = "small",
+        cache_dir: Path | None = None,
+        *,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        compute_type: str = "int8",
+        beam_size: int = 1,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        cache_max_age_seconds: float = DEFAULT_CACHE_MAX_AGE_SECONDS,
+    ) -> None:
         self._model_size = model_size
+        self._beam_size = max(1, beam_size)
+        self._compute_type = compute_type
+        self._cpu_threads = cpu_threads or os.cpu_count() or 0
+        self._num_workers = max(1, num_workers)
         self._model: WhisperModel | None = None
+        self._cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+        # Cached transcripts are user data: keep a bounded, expiring set. A cap of 0 disables the cache.
+        self._cache_max_entries = max(0, cache_max_entries)
+        self._cache_max_age_seconds = cache_max_age_seconds
+        if self._cache_max_entries == 0:
+            self._cache_dir = None
 
     def _get_model(self) -> WhisperModel:
         if self._model is None:
-            self._model = WhisperModel(self._model_size, device="cpu", compute_type="int8")
+            self._model = _load_whisper_model(
+                self._model_size, self._compute_type, self._cpu_threads, self._num_workers
+            )
         return self._model
 
-    def transcribe_bytes(self, audio_bytes: bytes, suffix: str = ".webm") -> str:
+    def warmup(self) -> None:
+        # Load weights and run one second of silence through the model so the first
+        # real claim doesn't pay for model load and kernel initialisation.
         model = self._get_model()
+        segments, _ = model.transcribe(np.zeros(16000, dtype=np.float32))
+        for _ in segments:
+            pass
+
+    def _cache_path(self, audio_bytes: bytes) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        key = hashlib.sha256(audio_bytes).hexdigest()
+        # Decoding settings change the transcript, so they are part of the key.
+        return self._cache_dir / f"{self._model_size}-{self._compute_type}-b{self._beam_size}-{key}.json"
+
+    def _read_cache(self, path: Path) -> str | None:
+        try:
+            if time.time() - path.stat().st_mtime > self._cache_max_age_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            with path.open("rb") as handle:
+                text = json.load(handle)["text"]
+            # Bump mtime so eviction drops the least recently used entries first.
+            os.utime(path)
+            return text
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("transcript_cache_unreadable", path=str(path), error=str(exc))
+            return None
+
+    def _write_cache(self, path: Path, text: str) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(
+                        {
+                            "text": text,
+                            "model": self._model_size,
+                            "compute_type": self._compute_type,
+                            "beam_size": self._beam_size,
+                        },
+                        handle,
+                    )
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as exc:
+            logger.warning("transcript_cache_write_failed", path=str(path), error=str(exc))
+            return
+        self._prune_cache(path.parent)
+
+    def _prune_cache(self, cache_dir: Path) -> None:
+        entries: list[tuple[float, Path]] = []
+        for entry in cache_dir.glob("*.json"):
+            try:
+                entries.append((entry.stat().st_mtime, entry))
+            except FileNotFoundError:
+                continue
+        entries.sort(reverse=True)
+
+        expires_before = time.time() - self._cache_max_age_seconds
+        for index, (mtime, entry) in enumerate(entries):
+            if index >= self._cache_max_entries or mtime < expires_before:
+                try:
+                    entry.unlink(missing_ok=True)
+                except OSError as exc:
+                    logger.warning("transcript_cache_evict_failed", path=str(entry), error=str(exc))
+
+    def _segments(self, model: WhisperModel, audio: str | BinaryIO) -> Iterable[Segment]:
+        segments, _ = model.transcribe(
+            audio,
+            beam_size=self._beam_size,
+            vad_filter=True,
+            vad_parameters=_VAD_PARAMETERS,
+        )
+        return segments
+
+    def _segments_via_tempfile(self, model: WhisperModel, audio_bytes: bytes, suffix: str) -> Iterable[Segment]:
         with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
             tmp.write(audio_bytes)
             tmp_path = Path(tmp.name)
 
+        # transcribe() loads the whole file up front and only segment decoding is lazy,
+        # so the file can go as soon as it returns.
         try:
-            segments, _ = model.transcribe(str(tmp_path), vad_filter=True)
-            text = " ".join(segment.text.strip() for segment in segments if segment.text.strip())
-            return text.strip()
+            return self._segments(model, str(tmp_path))
         finally:
             try:
                 os.remove(tmp_path)
             except OSError:
                 pass
+
+    def transcribe_stream(self, audio_bytes: bytes, suffix: str = ".webm") -> Iterator[str]:
+        """Yield non-empty segment texts as Whisper decodes them."""
+        model = self._get_model()
+        try:
+            segments = self._segments(model, io.BytesIO(audio_bytes))
+        except ValueError as exc:
+            # Some containers can't be demuxed from a non-seekable-by-name buffer;
+            # fall back to a named file so ffmpeg can probe it by extension.
+            logger.warning("transcribe_buffer_failed", suffix=suffix, error=str(exc))
+            segments = self._segments_via_tempfile(model, audio_bytes, suffix)
+
+        for segment in segments:
+            text = segment.text.strip()
+            if text:
+                yield text
+
+    def transcribe_bytes(self, audio_bytes: bytes, suffix: str = ".webm") -> str:
+        cache_path = self._cache_path(audio_bytes)
+        if cache_path is not None:
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                return cached
+
+        text = " ".join(self.transcribe_stream(audio_bytes, suffix)).strip()
+
+        if cache_path is not None and text:
+            self._write_cache(cache_path, text)
+        return text
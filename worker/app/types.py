@@ -13,3 +13,12 @@ class ClaimedRequest:
     raw_transcript: str | None
     lock_token: UUID
     attempts: int
+    # String forms used for logging and every database write; computed once per claim.
+    id_str: str = ""
+    lock_token_str: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.id_str:
+            self.id_str = str(self.id)
+        if not self.lock_token_str:
+            self.lock_token_str = str(self.lock_token)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import pytest
+
+
+@dataclass(slots=True, frozen=True)
+class FakeResult:
+    data: list[dict[str, Any]]
+
+
+@dataclass(slots=True, frozen=True)
+class FakeRPC:
+    data: list[dict[str, Any]]
+
+    def execute(self) -> FakeResult:
+        return FakeResult(self.data)
+
+
+@dataclass(slots=True)
+class FakeClient:
+    """Just enough of the supabase client for `client.rpc(name, params).execute()`."""
+
+    rpc_data: list[dict[str, Any]]
+    calls: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+
+    def rpc(self, name: str, params: dict[str, Any]) -> FakeRPC:
+        self.calls.append((name, params))
+        return FakeRPC(self.rpc_data)
+
+
+@pytest.fixture
+def make_fake_client() -> Callable[[list[dict[str, Any]]], FakeClient]:
+    return FakeClient
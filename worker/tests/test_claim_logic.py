@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from types import SimpleNamespace
+from typing import Any, Callable
 from uuid import uuid4
 from unittest.mock import MagicMock
 
@@ -18,19 +18,18 @@ def _settings() -> WorkerSettings:
         mailjet_api_key="mailjet-api-key",
         mailjet_api_secret="mailjet-api-secret",
         mailjet_from_email="noreply@example.com",
+        _env_file=None,
     )
 
 
 @pytest.mark.asyncio
-async def test_claim_due_requests_uses_rpc_and_parses_rows() -> None:
+async def test_claim_due_requests_uses_rpc_and_parses_rows(make_fake_client: Callable[..., Any]) -> None:
     request_id = uuid4()
     lock_token = uuid4()
     audio_id = uuid4()
 
-    client = MagicMock()
-    rpc_result = MagicMock()
-    rpc_result.execute.return_value = SimpleNamespace(
-        data=[
+    client = make_fake_client(
+        [
             {
                 "id": str(request_id),
                 "email": "user@example.com",
@@ -42,12 +41,11 @@ async def test_claim_due_requests_uses_rpc_and_parses_rows() -> None:
             }
         ]
     )
-    client.rpc.return_value = rpc_result
 
     repo = SupabaseWorkerRepository(_settings(), client=client)
     claimed = await repo.claim_due_requests(10)
 
-    client.rpc.assert_called_once_with("claim_due_requests", {"batch_size": 10})
+    assert client.calls == [("claim_due_requests", {"batch_size": 10})]
     assert len(claimed) == 1
     assert claimed[0].id == request_id
     assert claimed[0].lock_token == lock_token
@@ -59,12 +57,20 @@ async def test_claim_due_requests_uses_rpc_and_parses_rows() -> None:
 async def test_claim_due_requests_returns_empty_after_transport_failures(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    client = MagicMock()
+    clients = [MagicMock(), MagicMock()]
     rpc_result = MagicMock()
     rpc_result.execute.side_effect = httpx.RemoteProtocolError("Server disconnected")
-    client.rpc.return_value = rpc_result
+    for client in clients:
+        client.rpc.return_value = rpc_result
+
+    create_client = MagicMock(side_effect=clients)
+    monkeypatch.setattr("app.repository.create_client", create_client)
+    sleeps: list[float] = []
 
-    monkeypatch.setattr("app.repository.create_client", lambda *_args, **_kwargs: client)
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("app.repository.anyio.sleep", fake_sleep)
 
     settings = WorkerSettings(
         supabase_url="https://example.supabase.co",
@@ -74,9 +80,47 @@ async def test_claim_due_requests_returns_empty_after_transport_failures(
         mailjet_from_email="noreply@example.com",
         supabase_claim_retries=2,
         supabase_claim_retry_base_seconds=0.1,
+        _env_file=None,
     )
-    repo = SupabaseWorkerRepository(settings, client=client)
+    repo = SupabaseWorkerRepository(settings)
     claimed = await repo.claim_due_requests(10)
 
     assert claimed == []
-    assert client.rpc.call_count == 2
+    assert rpc_result.execute.call_count == settings.supabase_claim_retries
+    assert len(sleeps) == settings.supabase_claim_retries - 1
+    assert all(seconds >= settings.supabase_claim_retry_base_seconds for seconds in sleeps)
+    # The retry runs on a freshly built client and the stale one's connections are closed.
+    assert create_client.call_count == 2
+    clients[0].postgrest.aclose.assert_called_once()
+    assert clients[1].rpc.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_reset_client_rebuilds_postgrest_session() -> None:
+    settings = _settings().model_copy(update={"supabase_service_role_key": "header.payload.signature"})
+    repo = SupabaseWorkerRepository(settings)
+    stale_session = repo._client.postgrest.session
+
+    repo._reset_client()
+
+    assert stale_session.is_closed
+    session = repo._client.postgrest.session
+    assert isinstance(session, httpx.Client)
+    assert session is not stale_session
+    assert not session.is_closed
+    assert session.base_url == stale_session.base_url
+    await repo.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_only_owned_http_client(make_fake_client: Callable[..., Any]) -> None:
+    shared = httpx.AsyncClient()
+    borrowing = SupabaseWorkerRepository(_settings(), client=make_fake_client([]), http=shared)
+    owning = SupabaseWorkerRepository(_settings(), client=make_fake_client([]))
+
+    await borrowing.aclose()
+    await owning.aclose()
+
+    assert not shared.is_closed
+    assert owning._http.is_closed
+    await shared.aclose()
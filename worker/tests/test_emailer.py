@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from types import SimpleNamespace
+import json
 
+import anyio
+import httpx
 import pytest
 
 from app.config import WorkerSettings
@@ -17,17 +19,19 @@ def _settings(**overrides: object) -> WorkerSettings:
         "mailjet_from_email": "noreply@example.com",
     }
     base.update(overrides)
-    return WorkerSettings(**base)
+    return WorkerSettings(_env_file=None, **base)
 
 
-def test_send_summary_email_raises_helpful_error_on_401(monkeypatch: pytest.MonkeyPatch) -> None:
-    sender = MailjetEmailSender(_settings())
+def _client(response: httpx.Response) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(lambda request: response))
+
 
-    fake_response = SimpleNamespace(status_code=401, text='{"StatusCode":401}', json=lambda: {})
-    monkeypatch.setattr("app.emailer.requests.post", lambda *args, **kwargs: fake_response)
+@pytest.mark.asyncio
+async def test_send_summary_email_raises_helpful_error_on_401() -> None:
+    sender = MailjetEmailSender(_settings(), client=_client(httpx.Response(401, text='{"StatusCode":401}')))
 
     with pytest.raises(RuntimeError) as exc:
-        sender.send_summary_email(
+        await sender.send_summary_email(
             recipient="user@example.com",
             summary={"bullets": ["one"], "next_step": "do it"},
             request_id="req-1",
@@ -40,8 +44,8 @@ def test_send_summary_email_raises_helpful_error_on_401(monkeypatch: pytest.Monk
     assert "mail...5678" in message
 
 
-def test_send_summary_email_returns_message_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
-    sender = MailjetEmailSender(_settings())
+@pytest.mark.asyncio
+async def test_send_summary_email_returns_message_metadata() -> None:
     fake_body = {
         "Messages": [
             {
@@ -56,10 +60,9 @@ def test_send_summary_email_returns_message_metadata(monkeypatch: pytest.MonkeyP
             }
         ]
     }
-    fake_response = SimpleNamespace(status_code=200, text="ok", json=lambda: fake_body)
-    monkeypatch.setattr("app.emailer.requests.post", lambda *args, **kwargs: fake_response)
+    sender = MailjetEmailSender(_settings(), client=_client(httpx.Response(200, json=fake_body)))
 
-    result = sender.send_summary_email(
+    result = await sender.send_summary_email(
         recipient="user@example.com",
         summary={"bullets": ["one"], "next_step": "do it"},
         request_id="req-1",
@@ -71,6 +74,48 @@ def test_send_summary_email_returns_message_metadata(monkeypatch: pytest.MonkeyP
     assert result.message_href == "https://api.mailjet.com/v3/REST/message/123456"
 
 
+@pytest.mark.asyncio
+async def test_concurrent_sends_share_one_http2_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    recipients: list[str] = []
+    built: list[dict[str, object]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        message = json.loads(request.content)["Messages"][0]
+        recipients.append(message["To"][0]["Email"])
+        return httpx.Response(
+            200,
+            json={"Messages": [{"Status": "success", "To": [{"MessageID": message["CustomID"]}]}]},
+        )
+
+    real_client = httpx.AsyncClient
+
+    def build_client(**kwargs: object) -> httpx.AsyncClient:
+        built.append(kwargs)
+        return real_client(transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr("app.emailer.httpx.AsyncClient", build_client)
+    sender = MailjetEmailSender(_settings())
+    results: dict[str, str] = {}
+
+    async def send(index: int) -> None:
+        result = await sender.send_summary_email(
+            recipient=f"user{index}@example.com",
+            summary={"bullets": ["one"], "next_step": "do it"},
+            request_id=f"req-{index}",
+        )
+        results[f"req-{index}"] = result.message_id
+
+    async with anyio.create_task_group() as tg:
+        for index in range(3):
+            tg.start_soon(send, index)
+    await sender.aclose()
+
+    assert len(built) == 1
+    assert built[0]["http2"] is True
+    assert sorted(recipients) == [f"user{index}@example.com" for index in range(3)]
+    assert results == {f"req-{index}": f"req-{index}" for index in range(3)}
+
+
 def test_settings_accept_mj_aliases_and_trim_values(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service-role-key")
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import anyio
+import pytest
+
+from app.config import WorkerSettings
+from app.emailer import EmailSendResult
+from app.processor import WorkerProcessor
+from app.summarizer import DeterministicSummarizer
+from app.types import ClaimedRequest
+
+
+class _FakeRepository:
+    def __init__(self, claims: list[ClaimedRequest]) -> None:
+        self._claims = claims
+        self.completed: list[str] = []
+
+    async def claim_due_requests(self, batch_size: int) -> list[ClaimedRequest]:
+        claims, self._claims = self._claims[:batch_size], self._claims[batch_size:]
+        return claims
+
+    async def complete_sent(self, *, request_id: str, **_: Any) -> None:
+        self.completed.append(request_id)
+
+    async def handle_failure(self, **kwargs: Any) -> None:
+        raise AssertionError(f"unexpected failure: {kwargs}")
+
+
+class _SlowEmailer:
+    provider = "fake"
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+
+    async def send_summary_email(
+        self,
+        recipient: str,
+        summary: dict[str, object],
+        request_id: str | None = None,
+    ) -> EmailSendResult:
+        self.events.append(("start", str(request_id)))
+        await anyio.sleep(0.05)
+        self.events.append(("end", str(request_id)))
+        return EmailSendResult(
+            message_id=f"msg-{request_id}",
+            provider_status="success",
+            message_href=None,
+            recipient_state="queued",
+        )
+
+
+def _claim(transcript_id: UUID | None = None) -> ClaimedRequest:
+    return ClaimedRequest(
+        id=uuid4(),
+        email="user@example.com",
+        audio_id=None,
+        transcript_id=transcript_id,
+        raw_transcript="We shipped the beta. Support drafted the email. Next we need to confirm the rollout plan.",
+        lock_token=uuid4(),
+        attempts=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_once_runs_claims_concurrently() -> None:
+    claims = [_claim() for _ in range(4)]
+    repository = _FakeRepository(claims)
+    emailer = _SlowEmailer()
+    settings = WorkerSettings.model_construct(worker_batch_size=10, worker_claim_concurrency=4)
+
+    processor = WorkerProcessor(
+        settings=settings,
+        repository=repository,  # type: ignore[arg-type]
+        transcriber=None,  # type: ignore[arg-type]
+        summarizer=DeterministicSummarizer(),
+        emailer=emailer,  # type: ignore[arg-type]
+    )
+
+    with anyio.fail_after(1):
+        claimed = await processor.process_once()
+
+    assert claimed == 4
+    assert sorted(repository.completed) == sorted(claim.id_str for claim in claims)
+    # Every send starts before the first one finishes, i.e. the claims interleave.
+    assert [kind for kind, _ in emailer.events[:4]] == ["start"] * 4
+    assert [kind for kind, _ in emailer.events[4:]] == ["end"] * 4
+
+
+class _AudioRepository(_FakeRepository):
+    def __init__(self, claims: list[ClaimedRequest]) -> None:
+        super().__init__(claims)
+        self.inserted_transcripts = 0
+        self.failures: list[dict[str, Any]] = []
+
+    async def get_audio_asset(self, audio_id: UUID) -> dict[str, Any]:
+        return {"storage_path": f"uploads/{audio_id}.webm"}
+
+    async def download_audio_bytes(self, storage_path: str) -> bytes:
+        return b"audio"
+
+    async def insert_transcript(self, *, audio_id: UUID, text: str, provider: str) -> UUID:
+        self.inserted_transcripts += 1
+        return uuid4()
+
+    async def handle_failure(self, **kwargs: Any) -> None:
+        self.failures.append(kwargs)
+
+
+class _FlakyEmailer(_SlowEmailer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def send_summary_email(
+        self,
+        recipient: str,
+        summary: dict[str, object],
+        request_id: str | None = None,
+    ) -> EmailSendResult:
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("Mailjet unavailable")
+        return await super().send_summary_email(recipient, summary, request_id)
+
+
+@pytest.mark.asyncio
+async def test_retry_reuses_previous_attempt_summary() -> None:
+    claim = ClaimedRequest(
+        id=uuid4(),
+        email="user@example.com",
+        audio_id=uuid4(),
+        transcript_id=None,
+        raw_transcript=None,
+        lock_token=uuid4(),
+        attempts=1,
+    )
+    repository = _AudioRepository([claim])
+    transcriber = MagicMock(provider="fake-whisper")
+    transcriber.transcribe_bytes.return_value = "We shipped the beta. Next we need to confirm the rollout plan."
+    summarizer = MagicMock(wraps=DeterministicSummarizer())
+    settings = WorkerSettings.model_construct(worker_batch_size=10, worker_claim_concurrency=1, worker_max_attempts=3)
+
+    processor = WorkerProcessor(
+        settings=settings,
+        repository=repository,  # type: ignore[arg-type]
+        transcriber=transcriber,
+        summarizer=summarizer,
+        emailer=_FlakyEmailer(),  # type: ignore[arg-type]
+    )
+
+    with anyio.fail_after(1):
+        await processor.process_once()
+    assert len(repository.failures) == 1
+
+    # The row comes back with the same id and a new lock token after fail_request.
+    retry = ClaimedRequest(
+        id=claim.id,
+        email=claim.email,
+        audio_id=claim.audio_id,
+        transcript_id=None,
+        raw_transcript=None,
+        lock_token=uuid4(),
+        attempts=2,
+    )
+    repository._claims = [retry]
+    with anyio.fail_after(1):
+        await processor.process_once()
+
+    assert repository.completed == [claim.id_str]
+    assert summarizer.summarize.call_count == 1
+    assert transcriber.transcribe_bytes.call_count == 1
+    assert repository.inserted_transcripts == 1
+    assert processor._retry_memo == {}
+
+
+class _OverdueNotifier:
+    def __init__(self) -> None:
+        self.timeouts: list[float] = []
+
+    async def seconds_until_next_due(self) -> float | None:
+        return -5.0
+
+    async def wait(self, timeout: float) -> bool:
+        self.timeouts.append(timeout)
+        return False
+
+
+@pytest.mark.asyncio
+async def test_overdue_row_does_not_shorten_backoff() -> None:
+    notifier = _OverdueNotifier()
+    settings = WorkerSettings.model_construct(worker_poll_seconds=2.0, worker_poll_max_seconds=30.0)
+    processor = WorkerProcessor(
+        settings=settings,
+        repository=None,  # type: ignore[arg-type]
+        transcriber=None,  # type: ignore[arg-type]
+        summarizer=DeterministicSummarizer(),
+        emailer=None,  # type: ignore[arg-type]
+        notifier=notifier,  # type: ignore[arg-type]
+    )
+
+    for _ in range(3):
+        await processor._wait_for_work(processor._next_poll_seconds(0))
+
+    assert notifier.timeouts == [2.0, 4.0, 8.0]
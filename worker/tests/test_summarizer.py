@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from app.summarizer import DeterministicSummarizer
 
 
@@ -53,3 +55,29 @@ def test_summarizer_does_not_echo_entire_transcript_as_single_bullet() -> None:
     transcript_words = len(transcript.split())
     longest_bullet_words = max(len(item.split()) for item in summary["bullets"])
     assert longest_bullet_words < transcript_words
+
+
+def test_summarizer_reuses_cached_summary_for_identical_transcript(monkeypatch: pytest.MonkeyPatch) -> None:
+    transcript = (
+        "We agreed to ship the beta on Monday. "
+        "Support will draft the announcement email. "
+        "Next we need to confirm the rollback plan with infrastructure."
+    )
+
+    summarizer = DeterministicSummarizer(max_bullets=5)
+    calls = 0
+    select_bullets = summarizer._select_bullets
+
+    def counting_select_bullets(text: str, sentences: list[str]) -> list[str]:
+        nonlocal calls
+        calls += 1
+        return select_bullets(text, sentences)
+
+    monkeypatch.setattr(summarizer, "_select_bullets", counting_select_bullets)
+
+    first = summarizer.summarize(transcript)
+    first["bullets"].append("mutated by caller")
+    second = summarizer.summarize(transcript)
+
+    assert calls == 1
+    assert "mutated by caller" not in second["bullets"]
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from app.transcriber import WhisperTranscriber
+
+
+def _age(path: Path, seconds: float) -> None:
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    transcriber = WhisperTranscriber(cache_dir=tmp_path, cache_max_entries=2)
+    paths = {}
+    for index, audio in enumerate([b"a", b"b"]):
+        paths[audio] = transcriber._cache_path(audio)
+        transcriber._write_cache(paths[audio], f"text {audio!r}")
+        _age(paths[audio], 100 - index)
+
+    # Reading "a" makes "b" the least recently used entry.
+    assert transcriber._read_cache(paths[b"a"]) == "text b'a'"
+    paths[b"c"] = transcriber._cache_path(b"c")
+    transcriber._write_cache(paths[b"c"], "text b'c'")
+
+    assert paths[b"a"].exists()
+    assert not paths[b"b"].exists()
+    assert paths[b"c"].exists()
+
+
+def test_cache_expires_old_entries(tmp_path: Path) -> None:
+    transcriber = WhisperTranscriber(cache_dir=tmp_path, cache_max_age_seconds=60)
+    path = transcriber._cache_path(b"audio")
+    transcriber._write_cache(path, "hello")
+    _age(path, 120)
+
+    assert transcriber._read_cache(path) is None
+    assert not path.exists()
+
+
+def test_zero_entry_cap_disables_cache(tmp_path: Path) -> None:
+    transcriber = WhisperTranscriber(cache_dir=tmp_path, cache_max_entries=0)
+
+    assert transcriber._cache_path(b"audio") is None
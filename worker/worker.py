@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import sys
+
 import anyio
+import httpx
 
 from app.config import get_settings
 from app.emailer import MailjetEmailSender
 from app.logging_setup import configure_logging
+from app.notifications import PostgresRequestNotifier
 from app.processor import WorkerProcessor
 from app.repository import SupabaseWorkerRepository
 from app.summarizer import DeterministicSummarizer
@@ -13,17 +17,56 @@ from app.transcriber import WhisperTranscriber
 
 async def _main() -> None:
     settings = get_settings()
-    configure_logging(service="worker", level=settings.log_level)
+    configure_logging(
+        service="worker",
+        level=settings.log_level,
+        include_callsite=settings.log_level.upper() == "DEBUG",
+    )
+
+    notifier: PostgresRequestNotifier | None = None
+    if settings.supabase_db_url:
+        notifier = PostgresRequestNotifier(settings.supabase_db_url)
+        await notifier.connect()
 
+    transcriber = WhisperTranscriber(
+        model_size=settings.whisper_model_size,
+        cpu_threads=settings.whisper_cpu_threads,
+        num_workers=settings.whisper_num_workers,
+        compute_type=settings.whisper_compute_type,
+        beam_size=settings.whisper_beam_size,
+        cache_dir=settings.transcript_cache_dir,
+        cache_max_entries=settings.transcript_cache_max_entries,
+        cache_max_age_seconds=settings.transcript_cache_max_age_hours * 3600,
+    )
+    await anyio.to_thread.run_sync(transcriber.warmup)
+
+    # One pool (and one TLS context) for every outbound HTTP call the worker makes.
+    # Storage downloads and Mailjet sends each pass their own timeout per call.
+    http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0),
+        timeout=httpx.Timeout(10.0),
+    )
+    emailer = MailjetEmailSender(settings, client=http)
+    repository = SupabaseWorkerRepository(settings, http=http)
     processor = WorkerProcessor(
         settings=settings,
-        repository=SupabaseWorkerRepository(settings),
-        transcriber=WhisperTranscriber(model_size=settings.whisper_model_size),
+        repository=repository,
+        transcriber=transcriber,
         summarizer=DeterministicSummarizer(max_bullets=settings.summarizer_max_bullets),
-        emailer=MailjetEmailSender(settings),
+        emailer=emailer,
+        notifier=notifier,
     )
-    await processor.run_forever()
+    try:
+        await processor.run_forever()
+    finally:
+        await emailer.aclose()
+        await repository.aclose()
+        await http.aclose()
+        if notifier is not None:
+            await notifier.aclose()
 
 
 if __name__ == "__main__":
-    anyio.run(_main)
+    # uvloop's libuv loop is faster on the socket-heavy Supabase/Mailjet paths; it has no Windows build.
+    anyio.run(_main, backend_options={"use_uvloop": sys.platform != "win32"})